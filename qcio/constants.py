@@ -7,6 +7,7 @@ References:
 """
 
 import csv
+import functools
 from pathlib import Path
 from typing import Optional
 
@@ -57,6 +58,9 @@ _DATA_DIR = Path(__file__).parent / "constants_data"
 class Atom(BaseModel):
     """Atom data model."""
 
+    # Atoms are shared by every user of the periodic table, so don't allow mutation
+    model_config = {"extra": "forbid", "frozen": True}
+
     symbol: str
     number: int
     name: str
@@ -74,6 +78,12 @@ class PeriodicTable:
     data_source: str = ""
     data_url: str = ""
 
+    def __init__(self):
+        # Lookup indices populated alongside the Atom attributes
+        self._by_group: dict[int, list[Atom]] = {}
+        self._by_period: dict[int, list[Atom]] = {}
+        self._by_number: dict[int, Atom] = {}
+
     @classmethod
     def from_pubchem(cls):
         """Create a periodic table from PubChem data."""
@@ -81,61 +91,89 @@ class PeriodicTable:
         instance.data_source = "PubChem"
         instance.data_url = "https://pubchem.ncbi.nlm.nih.gov/periodic-table/"
 
-        group_and_period_data = {}
+        # csv.reader with column indices avoids building a dict for every row
+        group_and_period_data: dict[str, tuple[Optional[int], int]] = {}
 
         with open(_DATA_DIR / "group_period.csv") as file:
-            reader = csv.DictReader(file)
+            reader = csv.reader(file)
+            header = next(reader)
+            symbol_i, group_i, period_i = (
+                header.index(col) for col in ("Symbol", "Group", "Period")
+            )
             for row in reader:
-                group_and_period_data[row["Symbol"]] = {
-                    "group": int(row["Group"]) if row["Group"] else None,
-                    "period": int(row["Period"]),
-                }
+                group_and_period_data[row[symbol_i]] = (
+                    int(row[group_i]) if row[group_i] else None,
+                    int(row[period_i]),
+                )
 
         with open(_DATA_DIR / "pubchem.csv") as file:
-            reader = csv.DictReader(file)
+            reader = csv.reader(file)
+            header = next(reader)
+            symbol_i, number_i, name_i, mass_i, block_i, config_i = (
+                header.index(col)
+                for col in (
+                    "Symbol",
+                    "AtomicNumber",
+                    "Name",
+                    "AtomicMass",
+                    "GroupBlock",
+                    "ElectronConfiguration",
+                )
+            )
             for row in reader:
-                symbol = row["Symbol"]
-                atom = Atom(
+                symbol = row[symbol_i]
+                group, period = group_and_period_data[symbol]
+                # Values are already cast above, so skip pydantic validation
+                atom = Atom.model_construct(
                     symbol=symbol,
-                    number=int(row["AtomicNumber"]),
-                    name=row["Name"],
-                    mass=float(row["AtomicMass"]),
-                    group=group_and_period_data[symbol]["group"],
-                    period=group_and_period_data[symbol]["period"],
-                    block=row["GroupBlock"],
-                    electron_config=row["ElectronConfiguration"],
+                    number=int(row[number_i]),
+                    name=row[name_i],
+                    mass=float(row[mass_i]),
+                    group=group,
+                    period=period,
+                    block=row[block_i],
+                    electron_config=row[config_i],
                 )
                 setattr(instance, symbol, atom)
+                if atom.group is not None:
+                    instance._by_group.setdefault(atom.group, []).append(atom)
+                instance._by_period.setdefault(atom.period, []).append(atom)
+                instance._by_number[atom.number] = atom
         return instance
 
     def group(self, group_number: int) -> list[Atom]:
         """Return all atoms in a group."""
         assert 1 <= group_number <= 18, "Group number must be between 1 and 18."
-        return [
-            atom
-            for atom in self.__dict__.values()
-            if isinstance(atom, Atom) and atom.group == group_number
-        ]
+        return list(self._by_group.get(group_number, []))
 
     def period(self, period_number: int) -> list[Atom]:
         """Return all atoms in a period."""
         assert 1 <= period_number <= 7, "Period number must be between 1 and 7."
-        return [
-            atom
-            for atom in self.__dict__.values()
-            if isinstance(atom, Atom) and atom.period == period_number
-        ]
+        return list(self._by_period.get(period_number, []))
 
     def number(self, number: int) -> Atom:
         """Return an atom by atomic number."""
-        for atom in self.__dict__.values():
-            if isinstance(atom, Atom) and atom.number == number:
-                return atom
-        raise ValueError(f"No atom with atomic number {number}.")
+        try:
+            return self._by_number[number]
+        except KeyError:
+            raise ValueError(f"No atom with atomic number {number}.") from None
+
+
+@functools.cache
+def _load_periodic_table() -> PeriodicTable:
+    """Build the periodic table once, on first use."""
+    return PeriodicTable.from_pubchem()
+
+
+def __getattr__(name: str):
+    # PEP 562: defer parsing the periodic table data until it is first accessed
+    if name == "periodic_table":
+        return _load_periodic_table()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
-periodic_table = PeriodicTable.from_pubchem()
-"""Periodic table data from PubChem.
+periodic_table: PeriodicTable
+"""Periodic table data from PubChem. Loaded on first access.
 
     Attributes:
         data_source (str): Data source.
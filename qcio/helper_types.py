@@ -12,8 +12,8 @@ SerializableNDArray = Annotated[
     SkipValidation[np.ndarray],
     # Coerce values to float64 numpy array. Not required. Creates consistency.
     BeforeValidator(lambda x: np.array(x, dtype=np.float64)),
-    # Serializes the numpy array to a list
-    PlainSerializer(lambda x: np.array(x).tolist()),
+    # Serializes the numpy array to a list. asarray avoids copying existing arrays
+    PlainSerializer(lambda x: np.asarray(x).tolist()),
     # Describe json schema as a list of floats (numbers). Required for ChemCloud docs.
     GetPydanticSchema(
         lambda tp, handler: core_schema.with_default_schema(handler(list[float]))
@@ -1,6 +1,7 @@
 """The Base model from which all QCIO Model objects inherit."""
 
 import json
+import os
 from abc import ABC
 from base64 import b64decode, b64encode
 from enum import Enum
@@ -8,12 +9,11 @@ from pathlib import Path
 from typing import TYPE_CHECKING, Any, Optional, Union
 
 import numpy as np
-import toml
-import yaml
 from pydantic import BaseModel, field_serializer, field_validator
 from typing_extensions import Self
 
 from ..helper_types import StrOrPath
+from .utils import _as_path
 
 if TYPE_CHECKING:  # pragma: no cover
     from pydantic.typing import ReprArgs
@@ -21,6 +21,9 @@ if TYPE_CHECKING:  # pragma: no cover
 
 __all__ = ["Files", "Provenance", "Model", "CalcType"]
 
+# Marks binary file data that has been base64 encoded for serialization
+_B64_PREFIX = "base64:"
+
 
 class QCIOModelBase(BaseModel, ABC):
     """Base Model for all QCIO objects.
@@ -64,12 +67,19 @@ class QCIOModelBase(BaseModel, ABC):
             my_obj = MyModel.open("path/to/file.json")
             ```
         """
-        filepath = Path(filepath)
+        filepath = _as_path(filepath)
         data = filepath.read_text()
 
+        # yaml and toml are imported on first use to keep `import qcio` fast
         if filepath.suffix in [".yaml", ".yml"]:
-            return cls.model_validate(yaml.safe_load(data))
+            import yaml
+
+            # Use the libyaml C bindings when PyYAML was built with them
+            loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+            return cls.model_validate(yaml.load(data, Loader=loader))
         elif filepath.suffix == ".toml":
+            import toml
+
             return cls.model_validate(toml.loads(data))
 
         # Assume json for all other file extensions
@@ -126,7 +136,7 @@ class QCIOModelBase(BaseModel, ABC):
             my_obj.save("path/to/file.xyz")
             ```
         """
-        filepath = Path(filepath)
+        filepath = _as_path(filepath)
         filepath.parent.mkdir(exist_ok=True, parents=True)
 
         if self.extras:
@@ -141,9 +151,14 @@ class QCIOModelBase(BaseModel, ABC):
         )
 
         if filepath.suffix in [".yaml", ".yml"]:
-            data = yaml.dump(model_dict, indent=indent)
+            import yaml
+
+            dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+            data = yaml.dump(model_dict, Dumper=dumper, indent=indent)
 
         elif filepath.suffix == ".toml":
+            import toml
+
             data = toml.dumps(model_dict)
 
         else:
@@ -154,16 +169,11 @@ class QCIOModelBase(BaseModel, ABC):
 
     def __repr_args__(self) -> "ReprArgs":
         """Only show non empty fields in repr but always show success even if false."""
-
-        def exists(value):
-            if isinstance(value, np.ndarray):
-                return value.size > 0
-            return bool(value)
-
         return [  # pragma: no cover
             (name, value)
             for name, value in self.__dict__.items()
-            if name == "success" or exists(value)
+            if name == "success"
+            or (value.size > 0 if isinstance(value, np.ndarray) else bool(value))
         ]
 
     def __eq__(self, other: Any) -> bool:
@@ -171,6 +181,8 @@ class QCIOModelBase(BaseModel, ABC):
 
         Necessary because BaseModel.__eq__ does not compare numpy arrays.
         """
+        if self is other:  # Skip serializing both objects
+            return True
         if isinstance(other, self.__class__):
             return self.model_dump() == other.model_dump()
         return False
@@ -191,8 +203,10 @@ class Files(QCIOModelBase):
     def _convert_base64_to_bytes(cls, value):
         """Convert base64 encoded data to bytes."""
         for filename, data in value.items():
-            if isinstance(data, str) and data.startswith("base64:"):
-                value[filename] = b64decode(data[7:])
+            if isinstance(data, str) and data.startswith(_B64_PREFIX):
+                # Skip the prefix with a view rather than copying the string
+                encoded = memoryview(data.encode("ascii"))[len(_B64_PREFIX) :]
+                value[filename] = b64decode(encoded)
         return value
 
     @field_serializer("files")
@@ -200,7 +214,7 @@ class Files(QCIOModelBase):
         """Serialize files to a dict of filename to base64 encoded string."""
         return {
             filename: (
-                f"base64:{b64encode(data).decode('utf-8')}"
+                _B64_PREFIX + b64encode(data).decode("ascii")
                 if isinstance(data, bytes)
                 else data
             )
@@ -225,18 +239,26 @@ class Files(QCIOModelBase):
                 # Output: {"file.txt": "file data"}
             ```
         """
-        filepath = Path(filepath)
-        raw_bytes = filepath.read_bytes()
-        try:
-            data: Union[str, bytes] = raw_bytes.decode("utf-8")  # str
-        except UnicodeDecodeError:
-            data = raw_bytes  # bytes
-
+        filepath = _as_path(filepath)
         # Set filename relative to relative_dir
         if relative_dir:
             filename = str(filepath.relative_to(relative_dir))
         else:
             filename = filepath.name
+        self._add_file(filepath, filename)
+
+    def _add_file(self, filepath: Union[Path, str], filename: str) -> None:
+        """Read filepath and store its data under filename."""
+        with open(filepath, "rb") as f:
+            raw_bytes = f.read()
+        data: Union[str, bytes]
+        if raw_bytes.isascii():  # Most text files; no exception handling needed
+            data = raw_bytes.decode("ascii")  # str
+        else:
+            try:
+                data = raw_bytes.decode("utf-8")  # str
+            except UnicodeDecodeError:
+                data = raw_bytes  # bytes
 
         self.files[filename] = data
         # Add files to __pydantic_fields_set__ to ensure they are included in .save()
@@ -255,27 +277,48 @@ class Files(QCIOModelBase):
             recursive: Whether to recursively add files from subdirectories.
             exclude: A list of filenames to exclude from the directory.
         """
-        directory = Path(directory)
-        if exclude is None:
-            exclude = []
-        if recursive:
-            files = directory.rglob("*")
-        else:
-            files = directory.glob("*")
-        for filepath in files:
-            if filepath.is_file() and filepath.name not in exclude:
-                self.add_file(filepath, directory)
+        directory = _as_path(directory)
+        if not directory.is_dir():
+            return  # Nothing to add, as Path.glob/rglob yield nothing here
+        exclude_set = set(exclude or ())
+        # Walk with os.scandir: DirEntry answers is_file()/is_dir() from the directory
+        # listing on most platforms, avoiding a stat per path. Filenames relative to
+        # directory are built alongside the walk rather than with Path.relative_to.
+        directories: list[tuple[Union[str, Path], str]] = [(directory, "")]
+        while directories:
+            path, prefix = directories.pop()
+            try:
+                entries = os.scandir(path)
+            except PermissionError:
+                continue  # Skip unreadable directories, as Path.glob/rglob do
+            subdirs = []
+            with entries:
+                for entry in entries:
+                    filename = os.path.join(prefix, entry.name)
+                    if recursive and entry.is_dir(follow_symlinks=False):
+                        subdirs.append((entry.path, filename))
+                    elif entry.is_file() and entry.name not in exclude_set:
+                        self._add_file(entry.path, filename)
+            # Visit subdirectories depth-first in listing order, as Path.rglob does
+            directories.extend(reversed(subdirs))
 
     def save_files(self, directory: StrOrPath = Path(".")) -> None:
         """Write all files to the specified directory"""
-        directory = Path(directory)
+        directory = _as_path(directory)
         directory.mkdir(exist_ok=True)
+        filepaths = {filename: directory / filename for filename in self.files}
+        # In case filenames are relative paths, create each parent directory once.
+        # Bare filenames live in directory itself, which already exists.
+        parents = {filepath.parent for filepath in filepaths.values()} - {directory}
+        for parent in parents:
+            parent.mkdir(exist_ok=True, parents=True)
         for filename, data in self.files.items():
-            mode = "w" if isinstance(data, str) else "wb"
-            filepath = directory / filename
-            # In case filename is a relative path, create the parent directories
-            filepath.parent.mkdir(exist_ok=True, parents=True)
-            filepath.open(mode).write(data)
+            filepath = filepaths[filename]
+            # write_text/write_bytes close the file deterministically
+            if isinstance(data, str):
+                filepath.write_text(data)
+            else:
+                filepath.write_bytes(data)
 
     def __repr_args__(self) -> "ReprArgs":
         """Replace file data with '<bytes>' or '<str>' in __repr__."""
@@ -38,7 +38,6 @@ class FileInput(Files):
     def from_directory(cls, directory: Union[Path, str], **kwargs) -> Self:
         """Create a new FileInput and collect all files in the directory."""
         obj = cls(**kwargs)
-        directory = Path(directory)
         obj.add_files(directory)
         return obj
 
@@ -25,7 +25,12 @@ from qcio.helper_types import SerializableNDArray
 from .base_models import CalcType, Files, Provenance, QCIOModelBase
 from .inputs import DualProgramInput, FileInput, Inputs, InputType, ProgramInput
 from .structure import Structure
-from .utils import deprecated_class, rmsd
+from .utils import (
+    _kabsch_rmsd_batch,
+    _rdkit_best_rms,
+    _rdkit_connected_mol,
+    deprecated_class,
+)
 
 if TYPE_CHECKING:  # pragma: no cover
     pass
@@ -328,13 +333,13 @@ class ConformerSearchResults(Files):
         # Sort conformers and their energies together
         if self.conformer_energies.size > 0:
             sorted_indices = np.argsort(self.conformer_energies)
-            self.conformers[:] = [self.conformers[i] for i in sorted_indices]
+            self.conformers[:] = [self.conformers[i] for i in sorted_indices.tolist()]
             self.conformer_energies[:] = self.conformer_energies[sorted_indices]
 
         # Sort rotamers and their energies together
         if self.rotamer_energies.size > 0:
             sorted_indices = np.argsort(self.rotamer_energies)
-            self.rotamers[:] = [self.rotamers[i] for i in sorted_indices]
+            self.rotamers[:] = [self.rotamers[i] for i in sorted_indices.tolist()]
             self.rotamer_energies[:] = self.rotamer_energies[sorted_indices]
 
         return self
@@ -354,27 +359,65 @@ class ConformerSearchResults(Files):
         return self.rotamer_energies - self.rotamer_energies.min()
 
     def conformers_filtered(
-        self, threshold: float = 0.5, **rmsd_kwargs
+        self,
+        threshold: float = 0.5,
+        *,
+        best: bool = True,
+        numthreads: int = 1,
+        use_hueckel: bool = True,
+        use_vdw: bool = False,
+        cov_factor: float = 1.3,
     ) -> tuple[list[Structure], SerializableNDArray]:
         """Filter conformers to only unique Structures within rmsd of `threshold`.
 
         Args:
             threshold: The RMSD threshold in Angstrom for filtering conformers.
-            **rmsd_kwargs: Additional keyword arguments to pass to the rmsd function.
+            best: Whether to consider structure symmetries when calculating the RMSD.
+                See `qcio.rmsd` for details.
+            numthreads: The number of threads to use for the RMSD calculation. Applies
+                only if `best=True`.
+            use_hueckel: Whether to use Hueckel method when determining connectivity.
+                Applies only to `best=True`.
+            use_vdw: Whether to use Van der Waals radii when determining connectivity.
+                Applies only to `best=True`.
+            cov_factor: The scaling factor for the covalent radii when determining
+                connectivity. Applies only to `best=True`.
 
         Returns:
             Tuple of the filtered conformers and their relative energies.
         """
         filtered = set()
 
-        for i in range(len(self.conformers)):
-            if i not in filtered:
-                for j in range(i + 1, len(self.conformers)):
-                    if (
-                        rmsd(self.conformers[i], self.conformers[j], **rmsd_kwargs)
-                        < threshold
-                    ):
-                        filtered.add(j)
+        if best:
+            # Build each RDKit molecule and determine its connectivity only once rather
+            # than once per pairwise comparison.
+            # A single conformer has nothing to compare against, so skip building it.
+            mols = (
+                [
+                    _rdkit_connected_mol(
+                        conf,
+                        use_hueckel=use_hueckel,
+                        use_vdw=use_vdw,
+                        cov_factor=cov_factor,
+                    )
+                    for conf in self.conformers
+                ]
+                if len(self.conformers) > 1
+                else []
+            )
+            for i in range(len(self.conformers)):
+                if i not in filtered:
+                    for j in range(i + 1, len(self.conformers)):
+                        if _rdkit_best_rms(mols[i], mols[j], numthreads) < threshold:
+                            filtered.add(j)
+        else:
+            # Without symmetry considerations all remaining conformers can be aligned to
+            # the reference conformer in a single batched computation.
+            geometries = np.array([conf.geometry_angstrom for conf in self.conformers])
+            for i in range(len(self.conformers)):
+                if i not in filtered:
+                    rmsds = _kabsch_rmsd_batch(geometries[i + 1 :], geometries[i])
+                    filtered.update((np.nonzero(rmsds < threshold)[0] + i + 1).tolist())
 
         keep_indices = [i for i in range(len(self.conformers)) if i not in filtered]
         return [
@@ -1,6 +1,7 @@
 import warnings
 from collections import Counter
 from enum import Enum
+from itertools import chain
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, ClassVar, Optional, Union
 
@@ -8,8 +9,7 @@ import numpy as np
 from pydantic import field_serializer, model_validator
 from typing_extensions import Self
 
-from qcio.constants import BOHR_TO_ANGSTROM
-from qcio.constants import periodic_table as pt
+from qcio.constants import BOHR_TO_ANGSTROM, _load_periodic_table
 from qcio.helper_types import SerializableNDArray
 
 from .base_models import QCIOModelBase
@@ -323,14 +323,12 @@ class Structure(QCIOModelBase):
         other_comments: list[str] = []
 
         for item in lines[1].strip().split():
-            if item.startswith("qcio__identifiers_"):
-                key = item.split("=")[0].replace("qcio__identifiers_", "")
-                value = item.split("=")[1]
-                identifier_kwargs[key] = value
-            elif item.startswith("qcio_"):
-                key = item.split("=")[0].replace("qcio_", "")
-                value = item.split("=")[1]
-                structure_kwargs[key] = value
+            # Split on the first "=" only; values such as SMILES may contain "="
+            key, _, value = item.partition("=")
+            if key.startswith("qcio__identifiers_"):
+                identifier_kwargs[key[len("qcio__identifiers_") :]] = value
+            elif key.startswith("qcio_"):
+                structure_kwargs[key[len("qcio_") :]] = value
             else:
                 other_comments.append(item)
 
@@ -347,12 +345,13 @@ class Structure(QCIOModelBase):
         if multiplicity is not None:
             structure_kwargs["multiplicity"] = multiplicity
 
-        symbols = []
-        geometry = []
-        for line in lines[2 : 2 + num_atoms]:
-            split_line = line.split()
-            symbols.append(split_line[0])
-            geometry.append([float(val) / BOHR_TO_ANGSTROM for val in split_line[1:]])
+        atom_lines = [line.split() for line in lines[2 : 2 + num_atoms]]
+        symbols = [split_line[0] for split_line in atom_lines]
+        # Parse all coordinates and convert units in single NumPy operations
+        geometry = (
+            np.array([split_line[1:] for split_line in atom_lines], dtype=np.float64)
+            / BOHR_TO_ANGSTROM
+        )
 
         return cls(
             symbols=symbols,
@@ -484,10 +483,16 @@ class Structure(QCIOModelBase):
         xyz_lines.append(comments)
 
         # Create a format string using the precision parameter
-        format_str = f"{{:2s}} {{: >18.{precision}f}} {{: >18.{precision}f}} {{: >18.{precision}f}}"  # noqa: E501
+        line_fmt = f"%-2s %18.{precision}f %18.{precision}f %18.{precision}f"
 
-        for symbol, (x, y, z) in zip(self.symbols, geometry_angstrom):
-            xyz_lines.append(format_str.format(symbol, x, y, z))
+        # Format all atom lines in a single % operation rather than once per atom
+        if self.symbols:
+            atom_values = chain.from_iterable(
+                zip(self.symbols, *geometry_angstrom.T.tolist())
+            )
+            xyz_lines.append(
+                "\n".join([line_fmt] * len(self.symbols)) % tuple(atom_values)
+            )
         xyz_lines.append("")  # Append newline to end of file
         return "\n".join(xyz_lines)
 
@@ -567,6 +572,7 @@ class Structure(QCIOModelBase):
     def _validate_symbols_and_geometry(cls, values):
         """Ensure symbols are valid atomic symbols and geometry is correct."""
         symbols = [symbol.capitalize() for symbol in values.get("symbols", [])]
+        pt = _load_periodic_table()
         for symbol in symbols:
             if not hasattr(pt, symbol):
                 raise ValueError(f"Invalid atomic symbol: '{symbol}'")
@@ -575,7 +581,10 @@ class Structure(QCIOModelBase):
         geometry = values.get("geometry")
         if geometry is not None:
             n_atoms = len(values["symbols"])
-            values["geometry"] = np.array(geometry).reshape(n_atoms, 3)
+            # asarray: SerializableNDArray makes the model's own copy of the data
+            values["geometry"] = np.asarray(geometry, dtype=np.float64).reshape(
+                n_atoms, 3
+            )
 
         return values
 
@@ -596,6 +605,7 @@ class Structure(QCIOModelBase):
     @property
     def atomic_numbers(self) -> list[int]:
         """Return the atomic numbers of the atoms in the structure."""
+        pt = _load_periodic_table()
         return [getattr(pt, symbol).number for symbol in self.symbols]
 
     @property
@@ -621,17 +631,6 @@ class Structure(QCIOModelBase):
             for element, count in sorted_elements
         )
 
-    def model_dump(self, **kwargs) -> dict[str, Any]:
-        """Handle tuple in connectivity"""
-        as_dict = super().model_dump(**kwargs)
-        # Connectivity may be empty and super().dict() will remove empty values
-        if (connectivity := as_dict.get("connectivity")) is not None:
-            # Must cast all values to floats as toml cannot handle mixed types
-            as_dict["connectivity"] = [
-                [float(val) for val in bond] for bond in connectivity
-            ]
-        return as_dict
-
     def swap_indices(self, indices: list[tuple[int, int]]) -> None:
         """Swap the indices in the symbols and geometry list.
 
@@ -663,14 +662,15 @@ class Structure(QCIOModelBase):
             old_set.add(old)
             new_set.add(new)
 
-        # Perform reordering
-        new_symbols = [s for s in self.symbols]
-        new_geometry = np.array([g for g in self.geometry])
-        for old, new in indices:
-            new_symbols[new] = self.symbols[old]
-            new_geometry[new] = self.geometry[old]
+        # Perform reordering with fancy indexing rather than per-atom Python loops
+        old_idx, new_idx = np.array(indices, dtype=int).reshape(-1, 2).T
+        symbols = np.array(self.symbols)
+        new_symbols = symbols.copy()
+        new_symbols[new_idx] = symbols[old_idx]
+        new_geometry = self.geometry.copy()
+        new_geometry[new_idx] = self.geometry[old_idx]
 
-        object.__setattr__(self, "symbols", new_symbols)
+        object.__setattr__(self, "symbols", new_symbols.tolist())
         object.__setattr__(self, "geometry", new_geometry)
 
 
@@ -7,8 +7,8 @@ from typing import TYPE_CHECKING, Any
 
 import numpy as np
 
-from ..constants import ANGSTROM_TO_BOHR
-from ..constants import periodic_table as pt
+from ..constants import ANGSTROM_TO_BOHR, _load_periodic_table
+from ..helper_types import StrOrPath
 
 if TYPE_CHECKING:
     from qcio.models.structure import Structure
@@ -92,6 +92,11 @@ def renamed_class(new_cls: Any):
     return decorator
 
 
+def _as_path(path: StrOrPath) -> Path:
+    """Return path as a Path, without re-parsing it if it already is one."""
+    return path if isinstance(path, Path) else Path(path)
+
+
 def _assert_module_installed(module: str):
     """Raise an error if the module is not installed."""
     try:
@@ -173,6 +178,7 @@ def smiles_to_structure(
         mol.make3D(forcefield=force_field.lower(), steps=250)  # type: ignore
 
         # Get atom symbols
+        pt = _load_periodic_table()
         atoms = [pt.number(atom.atomicnum).symbol for atom in mol.atoms]  # type: ignore
 
         # Get atom positions
@@ -487,6 +493,138 @@ def _rdkit_determine_connectivity(
                     pass
 
 
+def _rdkit_connected_mol(
+    struct: "Structure",
+    use_hueckel: bool = True,
+    use_vdw: bool = False,
+    cov_factor: float = 1.3,
+) -> "rdkit.Chem.Mol":  # type: ignore # noqa: F821
+    """Create an RDKit molecule from a Structure and determine its connectivity.
+
+    Args:
+        struct: The Structure object.
+        use_hueckel: Whether to use Hueckel method when determining connectivity.
+        use_vdw: Whether to use Van der Waals radii when determining connectivity.
+        cov_factor: The scaling factor for the covalent radii when determining
+            connectivity.
+    """
+    mol = _rdkit_mol_from_structure(struct)
+    _rdkit_determine_connectivity(
+        mol,
+        charge=struct.charge,
+        use_hueckel=use_hueckel,
+        use_vdw=use_vdw,
+        cov_factor=cov_factor,
+    )
+    return mol
+
+
+def _rdkit_best_rms(
+    mol1: "rdkit.Chem.Mol",  # type: ignore # noqa: F821
+    mol2: "rdkit.Chem.Mol",  # type: ignore # noqa: F821
+    numthreads: int = 1,
+) -> float:
+    """Return the symmetry-aware RMSD between two RDKit molecules with connectivity.
+
+    Note:
+        mol2 is aligned to mol1 in place. The RMSD is invariant to this rigid
+        transformation so the molecules may be reused for further comparisons.
+    """
+    _assert_module_installed("rdkit")
+    from rdkit.Chem import rdMolAlign  # type: ignore
+
+    try:
+        return rdMolAlign.GetBestRMS(mol2, mol1, numThreads=numthreads)
+    except RuntimeError as e:  # Possible failure to make substructure match
+        try:  # Swap the order of the molecules and try again.
+            return rdMolAlign.GetBestRMS(mol1, mol2, numThreads=numthreads)
+        except RuntimeError:  # If it fails again, raise the original error
+            raise e
+
+
+def _horn_key_matrix(H: np.ndarray) -> np.ndarray:
+    """Return Horn's symmetric 4x4 key matrix for covariance matrices H.
+
+    Args:
+        H: A (..., 3, 3) array of covariance matrices.
+
+    Returns:
+        A (..., 4, 4) array of fully populated, symmetric key matrices.
+    """
+    Sxx, Sxy, Sxz = H[..., 0, 0], H[..., 0, 1], H[..., 0, 2]
+    Syx, Syy, Syz = H[..., 1, 0], H[..., 1, 1], H[..., 1, 2]
+    Szx, Szy, Szz = H[..., 2, 0], H[..., 2, 1], H[..., 2, 2]
+    # Fill the lower triangle of a preallocated array, then mirror it to the upper
+    K = np.empty(H.shape[:-2] + (4, 4))
+    K[..., 0, 0] = Sxx + Syy + Szz
+    K[..., 1, 0] = Syz - Szy
+    K[..., 1, 1] = Sxx - Syy - Szz
+    K[..., 2, 0] = Szx - Sxz
+    K[..., 2, 1] = Sxy + Syx
+    K[..., 2, 2] = -Sxx + Syy - Szz
+    K[..., 3, 0] = Sxy - Syx
+    K[..., 3, 1] = Szx + Sxz
+    K[..., 3, 2] = Syz + Szy
+    K[..., 3, 3] = -Sxx - Syy + Szz
+    upper = np.triu_indices(4, k=1)
+    K[(..., *upper)] = K[(..., upper[1], upper[0])]
+    return K
+
+
+def _kabsch_rmsd(P: np.ndarray, Q: np.ndarray) -> float:
+    """Return the RMSD between two sets of coordinates after optimal alignment.
+
+    Atoms are assumed to be in the same order in both sets of coordinates. Uses Horn's
+    closed-form quaternion method: the largest eigenvalue of a symmetric 4x4 key matrix
+    built from the covariance of the centered coordinates is the maximal overlap of the
+    two sets, so the aligned RMSD follows without constructing or applying the rotation.
+    A quaternion always describes a proper rotation, so no reflection correction is
+    required.
+
+    Args:
+        P: The (n_atoms, 3) coordinates to align.
+        Q: The (n_atoms, 3) reference coordinates.
+
+    Returns:
+        The RMSD in the units of the coordinates passed.
+    """
+    if P.shape != Q.shape:
+        raise ValueError("Coordinate arrays must have the same shape.")
+    P = P - P.mean(axis=0)
+    Q = Q - Q.mean(axis=0)
+    p, q = P.ravel(), Q.ravel()
+    # eigvalsh returns eigenvalues in ascending order
+    max_overlap = np.linalg.eigvalsh(_horn_key_matrix(P.T @ Q))[-1]
+    # Clamp tiny negative values from round-off for (near) identical coordinates
+    return float(np.sqrt(max((p @ p + q @ q - 2 * max_overlap) / P.shape[0], 0.0)))
+
+
+def _kabsch_rmsd_batch(Ps: np.ndarray, Q: np.ndarray) -> np.ndarray:
+    """Return the aligned RMSDs of many coordinate sets to one reference.
+
+    Each set is optimally aligned to the reference before its RMSD is computed. All
+    covariance matrices, key matrices, and eigenproblems are solved as stacked arrays
+    so the cost of NumPy/LAPACK dispatch is paid once rather than per set. See
+    `_kabsch_rmsd` for the method.
+
+    Args:
+        Ps: The (n_sets, n_atoms, 3) coordinates to align.
+        Q: The (n_atoms, 3) reference coordinates.
+
+    Returns:
+        An (n_sets,) array of RMSDs in the units of the coordinates passed.
+    """
+    if Ps.shape[1:] != Q.shape:
+        raise ValueError("Coordinate arrays must have the same shape.")
+    Ps = Ps - Ps.mean(axis=1, keepdims=True)
+    Q = Q - Q.mean(axis=0)
+    H = np.einsum("bni,nj->bij", Ps, Q)
+    max_overlaps = np.linalg.eigvalsh(_horn_key_matrix(H))[..., -1]
+    sum_squares = np.einsum("bni,bni->b", Ps, Ps) + np.einsum("ni,ni->", Q, Q)
+    msd = (sum_squares - 2 * max_overlaps) / Q.shape[0]
+    return np.sqrt(np.maximum(msd, 0.0))
+
+
 def rmsd(
     struct1: "Structure",
     struct2: "Structure",
@@ -504,9 +642,10 @@ def rmsd(
         struct2: The second structure.
         best: Whether to consider structure symmetries and align the structures before
             calculating the RMSD, including atom renumbering. This relies on the RDKit
-            `DetermineConnectivity` and `GetBestRMS` functions. If False, the RMSD is
-            calculated without alignment or atom renumbering, i.e., naively assuming the
-            atom indices are already correctly indexed and possibly aligned.
+            `DetermineConnectivity` and `GetBestRMS` functions. If False, the structures
+            are optimally aligned (rotation and translation) without atom renumbering,
+            i.e., naively assuming the atom indices are already correctly indexed. This
+            does not require RDKit.
         numthreads: The number of threads to use for the RMSD calculation. Applies only
             to the alignment step if `best=True`.
         use_hueckel: Whether to use Hueckel method when determining connectivity.
@@ -519,41 +658,15 @@ def rmsd(
     Returns:
         The RMSD between the two structures in Angstroms.
     """
-    _assert_module_installed("rdkit")
-    from rdkit.Chem import rdMolAlign  # type: ignore
-
-    # Create RDKit molecules
-    mol1 = _rdkit_mol_from_structure(struct1)
-    mol2 = _rdkit_mol_from_structure(struct2)
-
-    # Compute RMSD
-    if best:
-        # Determine connectivity
-        _rdkit_determine_connectivity(
-            mol1,
-            charge=struct1.charge,
-            use_hueckel=use_hueckel,
-            use_vdw=use_vdw,
-            cov_factor=cov_factor,
-        )
-
-        _rdkit_determine_connectivity(
-            mol2,
-            charge=struct2.charge,
-            use_hueckel=use_hueckel,
-            use_vdw=use_vdw,
-            cov_factor=cov_factor,
-        )
-        # Take symmetry into account, align the two molecules, compute RMSD
-        try:
-            rmsd = rdMolAlign.GetBestRMS(mol2, mol1, numThreads=numthreads)
-        except RuntimeError as e:  # Possible failure to make substructure match
-            try:  # Swap the order of the molecules and try again.
-                rmsd = rdMolAlign.GetBestRMS(mol1, mol2, numThreads=numthreads)
-            except RuntimeError:  # If it fails again, raise the original error
-                raise e
-
-    else:  # Do not take symmetry into account. Structs aligned by atom index.
-        rmsd, _ = rdMolAlign.GetAlignmentTransform(mol2, mol1)
-
-    return rmsd
+    if not best:  # Do not take symmetry into account. Structs aligned by atom index.
+        return _kabsch_rmsd(struct2.geometry_angstrom, struct1.geometry_angstrom)
+
+    # Create RDKit molecules and determine connectivity
+    mol1 = _rdkit_connected_mol(
+        struct1, use_hueckel=use_hueckel, use_vdw=use_vdw, cov_factor=cov_factor
+    )
+    mol2 = _rdkit_connected_mol(
+        struct2, use_hueckel=use_hueckel, use_vdw=use_vdw, cov_factor=cov_factor
+    )
+    # Take symmetry into account, align the two molecules, compute RMSD
+    return _rdkit_best_rms(mol1, mol2, numthreads=numthreads)
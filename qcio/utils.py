@@ -1,5 +1,6 @@
 """Utility functions for working with qcio objects."""
 
+import functools
 import json
 from collections import Counter
 from typing import Union
@@ -15,21 +16,36 @@ from .models.utils import (
     _rdkit_mol_from_structure,
 )
 
+
 # Helper Structures
-water = Structure(
-    symbols=["O", "H", "H"],
-    geometry=np.array(
-        [
-            [0.0253397, 0.01939466, -0.00696322],
-            [0.22889176, 1.84438441, 0.16251426],
-            [1.41760224, -0.62610794, -1.02954938],
-        ]
-    ),
-    charge=0,
-    multiplicity=1,
-    connectivity=[(0, 1, 1.0), (0, 2, 1.0)],
-    identifiers={"name": "water"},
-)
+@functools.cache
+def _water() -> Structure:
+    return Structure(
+        symbols=["O", "H", "H"],
+        geometry=np.array(
+            [
+                [0.0253397, 0.01939466, -0.00696322],
+                [0.22889176, 1.84438441, 0.16251426],
+                [1.41760224, -0.62610794, -1.02954938],
+            ]
+        ),
+        charge=0,
+        multiplicity=1,
+        connectivity=[(0, 1, 1.0), (0, 2, 1.0)],
+        identifiers={"name": "water"},
+    )
+
+
+def __getattr__(name: str):
+    # PEP 562: build helper structures on first access so importing qcio does not
+    # load the periodic table
+    if name == "water":
+        return _water()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+water: Structure
+"""A water Structure for testing and examples. Built on first access."""
 
 
 def json_dumps(obj: Union[BaseModel, list[BaseModel]]) -> str:
@@ -64,6 +80,15 @@ def align(
     Returns:
         Tuple of the aligned structure and the RMSD in Angstroms.
     """
+    # Check the atom counts before doing any RDKit work
+    if reorder_atoms and Counter(struct.symbols) != Counter(refstruct.symbols):
+        raise ValueError(
+            "Structures must have the same number and type of atoms for "
+            "`reorder_atoms=True` at this time. Pass "
+            "`reorder_atoms=False` to align structures with different atom "
+            "counts."
+        )
+
     _assert_module_installed("rdkit")
     from rdkit.Chem import rdMolAlign  # type: ignore
 
@@ -93,31 +118,20 @@ def align(
     else:
         rmsd_val, trnsfm_matrix = rdMolAlign.GetAlignmentTransform(mol, refmol)
 
-    # Convert to homogeneous coordinates in Angstroms
-    coords_homogeneous = np.hstack(
-        [struct.geometry_angstrom, np.ones((struct.geometry.shape[0], 1))]
-    )
-
-    # Apply the transformation matrix
-    transformed_coords_homogeneous = coords_homogeneous @ trnsfm_matrix.T
-
-    # Extract the transformed 3D coordinates and convert to Bohr
-    transformed_coords = transformed_coords_homogeneous[:, :3] * ANGSTROM_TO_BOHR
+    # Apply the rotation and translation from the 4x4 transformation matrix directly to
+    # the coordinates in Bohr rather than building homogeneous coordinates in Angstroms.
+    # Only the translation carries units (Angstroms).
+    rotation = trnsfm_matrix[:3, :3]
+    translation = trnsfm_matrix[:3, 3] * ANGSTROM_TO_BOHR
+    transformed_coords = struct.geometry @ rotation.T + translation
 
     # Reorder the atoms to match the reference structure
     if reorder_atoms:
-        if Counter(struct.symbols) != Counter(refstruct.symbols):
-            raise ValueError(
-                "Structures must have the same number and type of atoms for "
-                "`reorder_atoms=True` at this time. Pass "
-                "`reorder_atoms=False` to align structures with different atom "
-                "counts."
-            )
         symbols = refstruct.symbols
         geometry = np.zeros((len(atm_map), 3))
-
-        for probe_idx, ref_idx in atm_map:
-            geometry[ref_idx] = transformed_coords[probe_idx]  # works
+        # Scatter all atoms to their reference positions in a single indexing operation
+        probe_idx, ref_idx = np.array(atm_map, dtype=int).T
+        geometry[ref_idx] = transformed_coords[probe_idx]
 
     # Otherwise, keep the original atom order
     else:
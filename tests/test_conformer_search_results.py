@@ -102,3 +102,47 @@ def test_conformers_filtered(test_data_dir):
     for i, conf in enumerate(conf_filtered):
         assert conf == po_conf.conformers[selected[i]]
         assert energy_filtered[i] == po_conf.conformer_energies_relative[selected[i]]
+
+
+def test_conformers_filtered_no_best_matches_pairwise_rmsd(test_data_dir):
+    """Batched filtering without symmetries matches pairwise rmsd(best=False)."""
+    from qcio import rmsd
+
+    po_conf = ConformerSearchResults.open(test_data_dir / "conf_search.json")
+    conf_filtered, _ = po_conf.conformers_filtered(threshold=1.1, best=False)
+
+    filtered = set()
+    for i in range(len(po_conf.conformers)):
+        if i not in filtered:
+            for j in range(i + 1, len(po_conf.conformers)):
+                if rmsd(po_conf.conformers[i], po_conf.conformers[j], best=False) < 1.1:
+                    filtered.add(j)
+    expected = [c for i, c in enumerate(po_conf.conformers) if i not in filtered]
+
+    assert len(conf_filtered) == len(expected)
+    for conf, expected_conf in zip(conf_filtered, expected):
+        assert conf == expected_conf
+
+
+def test_conformers_filtered_single_conformer_skips_rdkit(water, monkeypatch):
+    """No RDKit molecules are built when there is nothing to compare."""
+    from qcio.models import outputs
+
+    def fail(*args, **kwargs):
+        raise AssertionError("RDKit molecule should not be built")
+
+    monkeypatch.setattr(outputs, "_rdkit_connected_mol", fail)
+    csr = ConformerSearchResults(conformers=[water], conformer_energies=[-1.0])
+
+    conf_filtered, energy_filtered = csr.conformers_filtered()
+    assert conf_filtered == [water]
+    assert np.array_equal(energy_filtered, [0.0])
+
+
+@pytest.mark.parametrize("best", [True, False])
+def test_conformers_filtered_rejects_unknown_rmsd_kwargs(water, best):
+    """Unknown keyword arguments raise rather than being silently ignored."""
+    csr = ConformerSearchResults(conformers=[water, water])
+
+    with pytest.raises(TypeError):
+        csr.conformers_filtered(best=best, use_hueckle=False)
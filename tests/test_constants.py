@@ -1,4 +1,8 @@
+import subprocess
+import sys
+
 import pytest
+from pydantic import ValidationError
 
 from qcio.constants import PeriodicTable
 from qcio.constants import periodic_table as pt
@@ -50,3 +54,26 @@ def test_group_and_period_data():
     assert [a.symbol for a in pt.period(6)] == ["Cs", "Ba", "La", "Ce", "Pr", "Nd", "Pm", "Sm", "Eu", "Gd", "Tb", "Dy", "Ho", "Er", "Tm", "Yb", "Lu", "Hf", "Ta", "W", "Re", "Os", "Ir", "Pt", "Au", "Hg", "Tl", "Pb", "Bi", "Po", "At", "Rn"]  # noqa: E501 
     assert [a.symbol for a in pt.period(7)] == ["Fr", "Ra", "Ac", "Th", "Pa", "U", "Np", "Pu", "Am", "Cm", "Bk", "Cf", "Es", "Fm", "Md", "No", "Lr", "Rf", "Db", "Sg", "Bh", "Hs", "Mt", "Ds", "Rg", "Cn", "Nh", "Fl", "Mc", "Lv", "Ts", "Og"]  # noqa: E501
     # fmt: on
+
+
+def test_periodic_table_loaded_lazily():
+    code = (
+        "import qcio, qcio.constants as c; "
+        "assert c._load_periodic_table.cache_info().currsize == 0; "
+        "assert c.periodic_table is c._load_periodic_table(); "
+        "s = qcio.Structure(symbols=['H'], geometry=[[0, 0, 0]]); "
+        "assert s.atomic_numbers == [1]"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_number_lookup():
+    assert pt.number(1) is pt.H
+    assert pt.number(118) is pt.Og
+    with pytest.raises(ValueError):
+        pt.number(119)
+
+
+def test_atoms_are_immutable():
+    with pytest.raises(ValidationError):
+        pt.H.mass = 2.0
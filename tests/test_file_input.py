@@ -22,6 +22,11 @@ def test_from_directory(test_data_dir):
             assert file == str_data
 
 
+def test_from_missing_directory(tmp_path):
+    file_inp = FileInput.from_directory(directory=tmp_path / "missing")
+    assert file_inp.files == {}
+
+
 def test_to_directory(test_data_dir, tmp_path):
     file_inp = FileInput.from_directory(
         directory=test_data_dir / "file_inputs",
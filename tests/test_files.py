@@ -1,4 +1,7 @@
 import json
+import os
+
+import pytest
 
 from qcio.models import Files
 
@@ -56,3 +59,60 @@ def test_files_recursive(test_data_dir, tmp_path):
     for filename in files.files.keys():
         assert (tmp_path / filename).exists()
         assert (tmp_path / filename).read_bytes() == (data_dir / filename).read_bytes()
+
+
+def test_add_files_recursive_exclude(tmp_path):
+    (tmp_path / "sub" / "deeper").mkdir(parents=True)
+    (tmp_path / "keep.txt").write_text("keep")
+    (tmp_path / "skip.txt").write_text("skip")
+    (tmp_path / "sub" / "deeper" / "nested.txt").write_text("nested")
+    (tmp_path / "sub" / "deeper" / "skip.txt").write_text("skip")
+
+    files = Files()
+    files.add_files(tmp_path, recursive=True, exclude=["skip.txt"])
+    assert files.files == {"keep.txt": "keep", "sub/deeper/nested.txt": "nested"}
+
+    # Files are added in the same order as Path.rglob visits them
+    for name in ("a", "b", "c"):
+        (tmp_path / name).mkdir()
+        (tmp_path / name / "f.txt").write_text(name)
+    files = Files()
+    files.add_files(tmp_path, recursive=True, exclude=["skip.txt"])
+    expected = [
+        str(path.relative_to(tmp_path))
+        for path in tmp_path.rglob("*")
+        if path.is_file() and path.name != "skip.txt"
+    ]
+    assert list(files.files) == expected
+
+    files = Files()
+    files.add_files(tmp_path, exclude=["skip.txt"])
+    assert files.files == {"keep.txt": "keep"}
+
+
+@pytest.mark.skipif(
+    not hasattr(os, "geteuid") or os.geteuid() == 0,
+    reason="Directory permissions are not enforced for root",
+)
+def test_add_files_skips_unreadable_directories(tmp_path):
+    (tmp_path / "a.txt").write_text("a")
+    locked = tmp_path / "locked"
+    locked.mkdir()
+    (locked / "b.txt").write_text("b")
+    locked.chmod(0)
+    try:
+        files = Files()
+        files.add_files(tmp_path, recursive=True)
+    finally:
+        locked.chmod(0o755)
+    assert list(files.files) == ["a.txt"]
+
+
+@pytest.mark.parametrize("recursive", [True, False])
+def test_add_files_not_a_directory(tmp_path, recursive):
+    (tmp_path / "a.txt").write_text("a")
+
+    files = Files()
+    files.add_files(tmp_path / "missing", recursive=recursive)
+    files.add_files(tmp_path / "a.txt", recursive=recursive)
+    assert files.files == {}
@@ -51,6 +51,15 @@ def test_to_xyz_comments(test_data_dir):
     assert "qcio__identifiers_name=caffeine" in comments
 
 
+def test_xyz_identifier_values_with_equals_round_trip():
+    ethene = Structure(
+        symbols=["C", "C"],
+        geometry=[[0.0, 0.0, 0.0], [0.0, 0.0, 2.5]],
+        identifiers={"smiles": "C=C"},
+    )
+    assert Structure.from_xyz(ethene.to_xyz()).identifiers.smiles == "C=C"
+
+
 def test_to_from_file_json(test_data_dir, tmp_path):
     caffeine = Structure.open(test_data_dir / "caffeine.xyz")
     caffeine.save(tmp_path / "caffeine_copy.json")
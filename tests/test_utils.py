@@ -97,6 +97,31 @@ def test_align_identical_structures():
     ), "Aligned geometry should be the same as original"
 
 
+def test_align_returns_independent_structure():
+    """Test that the aligned structure does not share state with its inputs."""
+    symbols = ["N", "H", "H", "H"]
+    geometry = np.array(
+        [
+            [0.0, 0.0, 0.0],
+            [1.772, 0.0, 0.0],
+            [-0.591, 1.680, 0.0],
+            [-0.591, -0.840, 1.455],
+        ]
+    )
+    struct = Structure(
+        symbols=symbols, geometry=geometry, charge=0, extras={"key": "value"}
+    )
+    refstruct = Structure(symbols=symbols, geometry=geometry)
+
+    for reorder_atoms in (False, True):
+        aligned_struct, _ = align(struct, refstruct, reorder_atoms=reorder_atoms)
+        assert aligned_struct.extras == {}
+        assert "extras" not in aligned_struct.model_fields_set
+        assert "charge" in aligned_struct.model_fields_set
+        assert aligned_struct.symbols is not struct.symbols
+        assert aligned_struct.symbols is not refstruct.symbols
+
+
 def test_align_rotated_structure():
     """Test aligning a rotated structure to the reference structure."""
     symbols = ["O", "H", "H"]
@@ -273,3 +298,75 @@ def test_align_large_molecule():
 
     aligned_struct, calculated_rmsd = align(struct1, struct2, reorder_atoms=False)
     assert calculated_rmsd < 0.2, "RMSD should be low for slightly shifted structures"
+
+
+def test_rmsd_no_best_matches_rdkit():
+    """Test that the RMSD without atom renumbering matches RDKit's alignment."""
+    from rdkit.Chem import rdMolAlign
+
+    from qcio.models.utils import _rdkit_mol_from_structure
+
+    rng = np.random.default_rng(0)
+    symbols = ["C", "C", "O", "H", "H", "H", "H", "H", "H"]
+    geometry = rng.random((9, 3)) * 4
+
+    # Rotate, translate, and perturb the second structure
+    theta = 0.7
+    rotation_matrix = np.array(
+        [
+            [np.cos(theta), 0.0, np.sin(theta)],
+            [0.0, 1.0, 0.0],
+            [-np.sin(theta), 0.0, np.cos(theta)],
+        ]
+    )
+    geometry2 = geometry @ rotation_matrix.T + 3.0 + rng.random((9, 3)) * 0.2
+
+    struct1 = Structure(symbols=symbols, geometry=geometry)
+    struct2 = Structure(symbols=symbols, geometry=geometry2)
+
+    expected, _ = rdMolAlign.GetAlignmentTransform(
+        _rdkit_mol_from_structure(struct2), _rdkit_mol_from_structure(struct1)
+    )
+    assert np.isclose(rmsd(struct1, struct2, best=False), expected, atol=1e-8)
+
+
+def test_rmsd_no_best_does_not_reflect():
+    """Test that alignment uses a proper rotation and never a reflection."""
+    symbols = ["C", "H", "F", "Cl", "Br"]
+    geometry = np.array(
+        [
+            [0.0, 0.0, 0.0],
+            [0.0, 0.0, 2.0],
+            [1.9, 0.0, -0.7],
+            [-1.0, -1.7, -0.7],
+            [-1.0, 1.7, -0.7],
+        ]
+    )
+    mirrored = geometry * np.array([1.0, 1.0, -1.0])
+
+    struct1 = Structure(symbols=symbols, geometry=geometry)
+    struct2 = Structure(symbols=symbols, geometry=mirrored)
+
+    assert rmsd(struct1, struct2, best=False) > 0.1
+
+
+def test_rmsd_no_best_raises_on_different_atom_counts():
+    """Test that a clear error is raised when atom counts differ and best=False."""
+    struct1 = Structure(symbols=["H", "H"], geometry=[[0, 0, 0], [0, 0, 1.4]])
+    struct2 = Structure(
+        symbols=["H", "H", "H"], geometry=[[0, 0, 0], [0, 0, 1.4], [0, 0, 2.8]]
+    )
+
+    with pytest.raises(ValueError, match="same shape"):
+        rmsd(struct1, struct2, best=False)
+
+
+def test_horn_key_matrix_is_symmetric():
+    """Test that the full key matrix is populated, not only its lower triangle."""
+    from qcio.models.utils import _horn_key_matrix
+
+    H = np.random.default_rng(0).normal(size=(4, 3, 3))
+    K = _horn_key_matrix(H)
+
+    assert np.allclose(K, np.swapaxes(K, -1, -2))
+    assert np.allclose(K[0], _horn_key_matrix(H[0]))